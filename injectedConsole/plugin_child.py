@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+# Started by `plugin_help.function.run_plugin(..., run_in_process=True)`, 
+# usage: INJCONSOLE_ENVFILE=/path/to/env.py python plugin_child.py /path/to/plugin
+
+if __name__ != '__main__':
+    raise RuntimeError('plugin_child.py can only run as a main file')
+
+import os, sys
+
+with open(os.environ['INJCONSOLE_ENVFILE'], encoding='utf-8') as f:
+    exec(f.read(), globals())
+del f
+
+file_or_dir = sys.argv[1]
+try:
+    retcode = plugin.function._run_plugin(file_or_dir, bc) # type: ignore
+    print("plugin %r \n\t |_ return ➜ %r" % (file_or_dir, retcode))
+    if type(retcode) is not int:
+        retcode = 0
+except BaseException:
+    retcode = -1
+
+if retcode != 0:
+    __import__('atexit').unregister(plugin.dump_wrapper) # type: ignore
+    os._exit(retcode)
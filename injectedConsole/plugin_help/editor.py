@@ -21,7 +21,7 @@ import sys
 from contextlib import contextmanager
 from enum import Enum
 from functools import partial
-from re import compile as re_compile, Match, Pattern
+from re import compile as re_compile, escape as re_escape, IGNORECASE, Match, Pattern
 from typing import (
     cast, Any, AnyStr, Callable, ContextManager, Dict, Final, 
     Generator, Iterable, Iterator, List, Mapping, MutableMapping, 
@@ -452,6 +452,7 @@ def ctx_edit_sgml(
     bc: Optional[BookContainer] = None, 
     fromstring: Callable = xml_fromstring,
     tostring: Callable[..., Union[bytes, bytearray, str]] = xml_tostring,
+    content: Optional[str] = None, 
 ) -> Generator[Any, Any, bool]:
     '''Read and yield the etree object (parsed from a xml file), 
     and then write back the above etree object.
@@ -467,6 +468,8 @@ def ctx_edit_sgml(
                        Returns the root node (or the result returned by a parser target).
     :param tostring: Serialize an element to an encoded string representation of its XML
                      or SGML tree.
+    :param content: The content of the file, if it has already been read 
+                    (so it will not be read again).
 
     Example::
         def operations_on_etree(etree):
@@ -479,7 +482,8 @@ def ctx_edit_sgml(
     '''
     bc = cast(BookContainer, _ensure_bc(bc, 3))
 
-    content = bc.readfile(manifest_id)
+    if content is None:
+        content = bc.readfile(manifest_id)
     tree = fromstring(content.encode('utf-8'))
 
     try:
@@ -509,6 +513,7 @@ def ctx_edit_sgml(
 def ctx_edit_html(
     manifest_id: str, 
     bc: Optional[BookContainer] = None, 
+    content: Optional[str] = None, 
 ) -> Generator[Any, Any, bool]:
     '''Read and yield the etree object (parsed from a (X)HTML file), 
     and then write back the above etree object.
@@ -520,6 +525,8 @@ def ctx_edit_html(
         If it is None (the default), will be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
+    :param content: The content of the file, if it has already been read 
+                    (so it will not be read again).
 
     Example::
         def operations_on_etree(etree):
@@ -540,6 +547,7 @@ def ctx_edit_html(
             html_tostring, 
             method='xhtml' if 'xhtml' in bc.id_to_mime(manifest_id) else 'html',
         ),
+        content, 
     ))
 
 
@@ -750,6 +758,8 @@ def edit_html_iter(
             operations_on_etree(etree)
             # If you don't need writing back
             ## edit_worker.throw(DoNotWriteBack)
+            # NOTE: `edit_worker.send(None)` is equivalent to `next(edit_worker)`, 
+            #       so do not send None to skip writing back.
 
         # OR equivalent to
         for fid, data in edit_html_iter(`manifest_id_s`, `bc`, wrap_me=True):
@@ -788,13 +798,17 @@ def edit_html_iter(
                         'data': tree, 
                         'write_back': True, 
                     }
-                    recv_data = yield fid, data
-                    if recv_data is None:
-                        if data.get('data') is None or not data.get('write_back'):
-                            raise DoNotWriteBack
-                        raise WriteBack(data['data'])
-                else:
-                    recv_data = yield fid, tree
+                try:
+                    recv_data = yield fid, (data if wrap_me else tree)
+                except DoNotWriteBack:
+                    # Make `.throw(DoNotWriteBack)` return None (just like `.send(...)`), 
+                    # so the next file will not be consumed (and skipped) by the `for` loop
+                    yield
+                    raise
+                if wrap_me and recv_data is None:
+                    if data.get('data') is None or not data.get('write_back'):
+                        raise DoNotWriteBack
+                    raise WriteBack(data['data'])
                 if recv_data is not None:
                     while True:
                         send_data = recv_data
@@ -899,6 +913,19 @@ if _LXML_IMPORTED:
             raise TypeError(f"expected value's type in ({enum_cls!r}"
                             f", int, str), got {val_cls}")
 
+    def _simple_tag_of(
+        path: str, 
+        seltype: EnumSelectorType, 
+        _cre_css=re_compile(r'\s*([a-zA-Z][\w-]*)\s*'), 
+        _cre_xpath=re_compile(
+            r'\s*(?:\.?//|(?:descendant|descendant-or-self)::)([a-zA-Z][\w-]*)\s*'), 
+    ) -> Optional[str]:
+        '''If the selector `path` only selects elements by a tag name 
+        (without namespace prefix), return the tag name, else return None.'''
+        cre = _cre_css if seltype is EnumSelectorType.cssselect else _cre_xpath
+        match = cre.fullmatch(path)
+        return None if match is None else match[1]
+
     def element_iter(
         path: Union[str, XPath] = 'descendant-or-self::*', 
         bc: Optional[BookContainer] = None, 
@@ -906,6 +933,7 @@ if _LXML_IMPORTED:
         namespaces: Optional[Mapping] = None, 
         translator: Union[str, GenericTranslator] = 'xml',
         more_info: bool = False,
+        fast_skip: bool = False, 
     ) -> Union[Generator[Element, None, None], Generator[IterElementInfo, None, None]]:
         '''Traverse all (X)HTML files in epub, search the elements that match the path, 
         and return the relevant information of these elements one by one.
@@ -944,6 +972,11 @@ if _LXML_IMPORTED:
         :param more_info: Determine whether to wrap the yielding results.
             If false, the yielding results are the match objects of the `path` expression,
             else are the namedtuple `IterElementInfo` objects (with some context information).
+        :param fast_skip: If True and `path` only selects elements by a tag name 
+            (e.g. CSS Selector 'img', or XPath '//img'), the files whose source 
+            do not contain the start tag will be skipped without parsing.
+            NOTE: Tags that only appear in comments or CDATA sections will still 
+                  cause the files to be parsed, but no file with matches will be skipped.
 
         :return: Generator, if `more_info` is True, then yield `IterElementInfo` object, 
                 else yield `Element` object.
@@ -960,32 +993,45 @@ if _LXML_IMPORTED:
                 operations_on_element(info.element)
         '''
         select: XPath
+        tag: Optional[str] = None
         if isinstance(path, str):
-            if EnumSelectorType.of(seltype) is EnumSelectorType.cssselect:
+            seltype = EnumSelectorType.of(seltype)
+            if seltype is EnumSelectorType.cssselect:
                 select = CSSSelector(
                     path, namespaces=namespaces, translator=translator)
             else:
                 select = XPath(path, namespaces=namespaces)
+            if fast_skip:
+                tag = _simple_tag_of(path, seltype)
         else:
             select = path
 
         bc = cast(BookContainer, _ensure_bc(bc))
 
+        search_tag: Optional[Callable] = None
+        if tag is not None:
+            search_tag = re_compile(r'<%s[\s/>]' % re_escape(tag), IGNORECASE).search
+
         global_no: int = 0
-        data: dict
-        for file_no, (fid, tree) in enumerate(edit_html_iter(bc=bc), 1): # type: ignore
+        content: Optional[str] = None
+        for file_no, (fid, _) in enumerate(bc.text_iter(), 1):
+            if search_tag is not None:
+                # The content is passed on to `ctx_edit_html`, so it's only read once
+                content = bc.readfile(fid)
+                if search_tag(content) is None:
+                    continue
             href = bc.id_to_href(fid)
             mime = bc.id_to_mime(fid)
-            els = select(tree)
-            if not els:
-                del data['write_back']
-                continue
-            if more_info:
-                for local_no, (global_no, el) in enumerate(enumerate(els, global_no + 1), 1):
-                    yield IterElementInfo(
-                        bc, fid, local_no, global_no, file_no, href, mime, el, tree)
-            else:
-                yield from els
+            with ctx_edit_html(fid, bc, content) as tree:
+                els = select(tree)
+                if not els:
+                    raise DoNotWriteBack
+                if more_info:
+                    for local_no, (global_no, el) in enumerate(enumerate(els, global_no + 1), 1):
+                        yield IterElementInfo(
+                            bc, fid, local_no, global_no, file_no, href, mime, el, tree)
+                else:
+                    yield from els
 
     __all__.extend(('IterElementInfo', 'EnumSelectorType', 'element_iter'))
 
@@ -1014,7 +1060,7 @@ class EditCache(MutableMapping[str, T]):
                 cache[fid] = cache[fid].replace('utf-8', 'UTF-8')
     '''
 
-    __context_factory__: Callable[[str, BookContainer], ContextManager] = lambda fid, bc: ctx_edit(fid, bc)
+    __context_factory__: Callable[[str, BookContainer], ContextManager] = ctx_edit
 
     def __init__(self, bc: Optional[BookContainer] = None) -> None:
         bc = cast(BookContainer, _ensure_bc(bc))
@@ -1057,7 +1103,7 @@ class EditCache(MutableMapping[str, T]):
     def __iter__(self) -> Iterator[str]:
         '''Iterate over all available [files' manifest ids] 
         (roughly from `bookcontainer.Bookcontainer.manifest_iter`).'''
-        yield from self._bc._w.id_to_mime
+        return iter(self._bc._w.id_to_mime)
 
     def iteritems(self) -> Iterator[Tuple[str, T]]:
         '''Iterate over all files (manifest ids are offered by `__iter__` method), 
@@ -1133,20 +1179,64 @@ class EditCache(MutableMapping[str, T]):
 
     __del__ = clear
 
+    def _open(self, fid: str, /) -> Tuple[T, ContextManager, Callable]:
+        'Enter the context of file `fid`, return its data object and exit callback.'
+        cm = type(self)._cm(self, fid, self._bc)
+        cm_type = type(cm)
+        return cm_type.__enter__(cm), cm, cm_type.__exit__
+
     def __getitem__(self, fid) -> T:
         '''Receive a file's manifest id `fid`, return the corresponding 
         of the file data object, otherwise raise `KeyError`.'''
         data = self._data
         if fid not in data:
             try:
-                cm = type(self)._cm(self, fid, self._bc)
-                cm_type = type(cm)
-                data[fid] = cm_type.__enter__(cm)
-                self._exit_cbs[fid] = (cm, cm_type.__exit__)
+                data[fid], cm, cm_exit = self._open(fid)
             except Exception as exc:
                 raise KeyError(fid) from exc
+            self._exit_cbs[fid] = (cm, cm_exit)
         return data[fid]
 
+    def preload(self, fids: Optional[Iterable[str]] = None) -> None:
+        '''Open the files corresponding to `fids` in advance, 
+        so that the following accesses to them do not need to open them one by one.
+
+        :param fids: Manifest ids of the files to be opened.
+            If it is None (the default), all files offered by `__iter__` method will be opened.
+
+        NOTE: The files are opened one by one in the current thread, 
+              because `BookContainer` object is not thread-safe.
+        NOTE: If any file failed to be opened, the files opened by this call 
+              are closed without writing back, and then raise `KeyError`.
+        '''
+        data = self._data
+        exit_cbs = self._exit_cbs
+        if fids is None:
+            fids = self
+        elif isinstance(fids, str):
+            fids = fids,
+        opened: List[str] = []
+        try:
+            for fid in fids:
+                if fid in data:
+                    continue
+                try:
+                    data[fid], cm, cm_exit = self._open(fid)
+                except Exception as exc:
+                    raise KeyError(fid) from exc
+                exit_cbs[fid] = (cm, cm_exit)
+                opened.append(fid)
+        except BaseException:
+            # Roll back, a file not in `self._data` will not be written back
+            for fid in reversed(opened):
+                del data[fid]
+                cm, cm_exit = exit_cbs.pop(fid)
+                try:
+                    cm_exit(cm, None, None, None)
+                except Exception:
+                    pass
+            raise
+
     def __setitem__(self, fid, data) -> None:
         '''Update the data of the corresponding manifest id `fid` to `data`.
         There are 2 restrictions:
@@ -1243,6 +1333,6 @@ class TextEditCache(EditCache[T]):
     def __iter__(self) -> Iterator[str]:
         '''Iterate over all available [files' manifest ids] (HTML / XHTML only)
         (from `bookcontainer.Bookcontainer.text_iter`).'''
-        for fid, *_ in self._bc.text_iter():
+        for fid, _ in self._bc.text_iter():
             yield fid
 
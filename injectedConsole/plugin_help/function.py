@@ -12,26 +12,29 @@ __all__ = [
 
 import builtins
 import re
+import site
 import subprocess
 import sys
 
 from contextlib import contextmanager
-from copy import deepcopy
-from os import _exit, path as _path, environ, getcwd
-from pickle import load as pickle_load, dump as pickle_dump
+from mmap import mmap, ACCESS_READ
+from os import (
+    _exit, close, fstat, open as os_open, path as _path, environ, getcwd, remove, 
+    replace, scandir, stat, stat_result, O_CREAT, O_TRUNC, O_WRONLY, 
+)
+from pickle import (
+    load as pickle_load, loads as pickle_loads, 
+    dumps as pickle_dumps, HIGHEST_PROTOCOL, 
+)
 from runpy import run_path
-from tempfile import NamedTemporaryFile
+from stat import S_ISDIR
 from traceback import print_exc
+from weakref import WeakValueDictionary
 from typing import (
-    cast, Final, Iterable, List, Mapping, Optional, Tuple
+    cast, Dict, Final, Iterable, List, Mapping, Optional, Tuple
 )
 from zipfile import ZipFile
 
-try:
-    from lxml.etree import parse as parse_xml_file # type: ignore
-except ImportError:
-    from xml.etree.ElementTree import parse as parse_xml_file
-
 from wrapper import Wrapper # type: ignore
 from bookcontainer import BookContainer # type: ignore
 from inputcontainer import InputContainer # type: ignore
@@ -41,18 +44,35 @@ from validationcontainer import ValidationContainer # type: ignore
 from plugin_util.colored import colored
 from plugin_util.console import start_specific_python_console
 from plugin_util.dictattr import DictAttr
+from plugin_util.platform_const import IS_WINDOWS as _SYSTEM_IS_WINDOWS
 from plugin_util.run import ctx_load, run_file, prun_module, restart_program
 from plugin_util.temporary import temp_list
 from plugin_util.usepip import check_install
 
 
-_SYSTEM_IS_WINDOWS: Final[bool] = __import__('platform').system() == 'Windows'
 _injectedConsole_CONFIG: Final[dict] = getattr(builtins, '_injectedConsole_CONFIG')
 _injectedConsole_PATH: Final[Mapping] = getattr(builtins, '_injectedConsole_PATH')
 _OUTDIR: Final[str] = _injectedConsole_PATH['outdir']
 _ABORTFILE: Final[str] = _path.join(_OUTDIR, 'abort.exists')
 _ENVFILE: Final[str] = _path.join(_OUTDIR, 'env.py')
 _PKLFILE: Final[str] = _path.join(_OUTDIR, 'wrapper.pkl')
+# Fixed script run by `run_plugin(..., run_in_process=True)` in a child process
+_CHILD_LAUNCHER: Final[str] = _path.join(_injectedConsole_PATH['this_plugin_dir'], 'plugin_child.py')
+# Buffer size of reading / writing `_PKLFILE`, collapses the pickler's small writes
+_PKLFILE_BUFSIZE: Final[int] = 1 << 20
+# (inode, mtime, size) of `_PKLFILE` when it was last dumped or loaded by this process
+_PKLFILE_STAMP: Tuple[int, int, int] = (0, 0, 0)
+# Module search prefixes that `_run_plugin` must not clean from `sys.path`
+_PREFIXES_NOT_CLEAN: Final[Tuple[str, ...]] = (
+    *frozenset(site.PREFIXES), _injectedConsole_PATH['sigil_package_dir'])
+# Colored tags that are printed repeatedly, formatted only once
+_TAG_ASK: Final[str]      = colored('[ASK]', 'red', attrs=['bold'])
+_TAG_WARNING: Final[str]  = colored('[WARRNING]', 'yellow', attrs=['bold'])
+_TAG_ERROR: Final[str]    = colored('[ERROR]', 'red', attrs=['bold'])
+_TAG_APPENDED: Final[str] = colored('◉ APPENDED', 'yellow', attrs=['bold', 'blink'])
+_TAG_LOADED: Final[str]   = colored('◉ LOADED', 'green', attrs=['bold', 'blink'])
+_TAG_FAILED: Final[str]   = colored('◉ ERROR', 'red', attrs=['bold', 'blink'])
+_RUN_ENV_TIP: Final[str]  = colored('%run env', 'red', attrs=['bold', 'blink'])
 _WRAPPER: Optional[Wrapper] = None
 _EDIT_CONTAINER: Optional[BookContainer] = None
 _INPUT_CONTAINER: Optional[InputContainer] = None
@@ -62,35 +82,100 @@ _VALIDATION_CONTAINER: Optional[ValidationContainer] = None
 
 def abort() -> None:
     'Abort console to discard all changes.'
-    open(_ABORTFILE, 'wb').close()
+    # Only the existence of the file matters, so create it with bare syscalls
+    close(os_open(_ABORTFILE, O_WRONLY | O_CREAT | O_TRUNC, 0o666))
     _exit(1)
 
 
 def exit() -> None:
-    'Exit console for no more operations.'
-    dump_wrapper()
+    '''Exit console for no more operations.
+    NOTE: The wrapper is not dumped again if the file already holds the same pickle.'''
+    dump_wrapper(force=False)
     _exit(0)
 
 
-def dump_wrapper(wrapper: Optional[Wrapper] = None) -> None:
-    'Dump wrapper to file.'
+def _stamp(st: stat_result) -> Tuple[int, int, int]:
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def dump_wrapper(wrapper: Optional[Wrapper] = None, force: bool = True) -> None:
+    '''Dump wrapper to file.
+
+    :param force: If False, and the file has not been changed since the global 
+        wrapper was last dumped or loaded, and it already holds the same pickle, 
+        the writing will be skipped.
+    '''
+    global _PKLFILE_STAMP
     if wrapper is None:
         wrapper = _WRAPPER
-    pickle_dump(wrapper, open(_PKLFILE, 'wb'))
+    data = pickle_dumps(wrapper, HIGHEST_PROTOCOL)
+    # The file is only read back for comparison if the sizes are equal
+    if not force and wrapper is _WRAPPER and len(data) == _PKLFILE_STAMP[2]:
+        try:
+            with open(_PKLFILE, 'rb', buffering=0) as f:
+                if _stamp(fstat(f.fileno())) == _PKLFILE_STAMP and f.read() == data:
+                    return
+        except FileNotFoundError:
+            pass
+    _PKLFILE_STAMP = (0, 0, 0)
+    # Write to a temporary file and then replace, so that the file is never seen 
+    # half-written, and every dump gets a new inode (a reliable stamp)
+    tmpfile = _PKLFILE + '.tmp'
+    try:
+        with open(tmpfile, 'wb', buffering=_PKLFILE_BUFSIZE) as f:
+            f.write(data)
+        replace(tmpfile, _PKLFILE)
+    except BaseException:
+        # Do not leave a truncated temporary file behind
+        try:
+            remove(tmpfile)
+        except OSError:
+            pass
+        raise
+    if wrapper is _WRAPPER:
+        _PKLFILE_STAMP = _stamp(stat(_PKLFILE))
+
+
+def load_wrapper(force: bool = False) -> Wrapper:
+    '''Load wrapper from file.
+
+    :param force: If False (the default), and the file has not been changed since 
+        it was last dumped or loaded by this process, the loading will be skipped.
+    '''
+    global _PKLFILE_STAMP
+    if not force and _WRAPPER is not None and _stamp(stat(_PKLFILE)) == _PKLFILE_STAMP:
+        return _WRAPPER
+    with open(_PKLFILE, 'rb', buffering=_PKLFILE_BUFSIZE) as f:
+        stamp = _stamp(fstat(f.fileno()))
+        # Unpickle straight from the page cache, instead of copying 
+        # the file chunk by chunk through the read buffer
+        try:
+            mm = mmap(f.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # An empty file can't be mapped, let `pickle` raise EOFError
+            wrapper = pickle_load(f)
+        else:
+            with mm:
+                wrapper = pickle_loads(mm)
+    _install_wrapper(wrapper)
+    _PKLFILE_STAMP = stamp
+    return cast(Wrapper, _WRAPPER)
 
 
-def load_wrapper() -> Wrapper:
-    'Load wrapper from file.'
+def _install_wrapper(wrapper: Wrapper) -> Wrapper:
+    'Make the global `_WRAPPER` hold the data of `wrapper`.'
     global _WRAPPER, _EDIT_CONTAINER, _INPUT_CONTAINER, \
-           _OUTPUT_CONTAINER, _VALIDATION_CONTAINER
-    wrapper = pickle_load(open(_PKLFILE, 'rb'))
+           _OUTPUT_CONTAINER, _VALIDATION_CONTAINER, _PKLFILE_STAMP
+    if wrapper is not _WRAPPER:
+        # No longer the same as the file
+        _PKLFILE_STAMP = (0, 0, 0)
     if _WRAPPER is None:
         _WRAPPER              = wrapper
         _EDIT_CONTAINER       = BookContainer(wrapper)
         _INPUT_CONTAINER      = InputContainer(wrapper)
         _OUTPUT_CONTAINER     = OutputContainer(wrapper)
         _VALIDATION_CONTAINER = ValidationContainer(wrapper)
-    else:
+    elif _WRAPPER is not wrapper:
         _WRAPPER.__dict__.clear()
         _WRAPPER.__dict__.update(wrapper.__dict__)
     return _WRAPPER
@@ -102,79 +187,107 @@ except FileNotFoundError:
 
 
 @contextmanager
-def _ctx_wrapper():
-    dump_wrapper()
+def _ctx_wrapper(persist: bool = True):
+    '''Dump the wrapper to file at the beginning (skipped if unchanged), and load it back at the end.
+
+    :param persist: If False, do not dump and load, just yield the wrapper.
+        The file is only used to share the wrapper with child processes, 
+        so it is unnecessary when the code runs in the current process.
+    '''
+    if not persist:
+        yield _WRAPPER
+        return
+    dump_wrapper(force=False)
     yield _WRAPPER
     load_wrapper()
 
 
+# Results of `get_container`, keyed by the id of the wrapper
+_CONTAINER_CACHE: Final[WeakValueDictionary] = WeakValueDictionary()
+# Container class of each plugin type
+_CONTAINER_TYPES: Final[Mapping[str, type]] = {
+    'edit':       BookContainer, 
+    'input':      InputContainer, 
+    'output':     OutputContainer, 
+    'validation': ValidationContainer, 
+}
+
+
 def get_container(wrapper=None) -> Mapping:
-    'Get the sigil containers.'
+    'Get the sigil containers (they are reused while still referenced).'
     if wrapper is None:
         wrapper = _WRAPPER
 
+    # NOTE: The cached `DictAttr` holds `wrapper`, so while the cache entry 
+    #       is alive, `id(wrapper)` can't be reused by another object
+    key = id(wrapper)
+    try:
+        return _CONTAINER_CACHE[key]
+    except KeyError:
+        pass
+
     # collect the containers
-    return DictAttr(
+    container = _CONTAINER_CACHE[key] = DictAttr(
         wrapper    = wrapper,
         edit       = BookContainer(wrapper),
         input      = InputContainer(wrapper),
         output     = OutputContainer(wrapper),
         validation = ValidationContainer(wrapper),
     )
+    return container
+
+
+def _split_shell_flags(argv: Iterable[str]) -> Tuple[List[str], Dict[str, str]]:
+    '''Split `argv` in one pass into the other arguments and a dict of 
+    `--shell` / `--prev-shell` to their values (the last one wins, like `argparse`).'''
+    rest: List[str] = []
+    flags: Dict[str, str] = {}
+    it = iter(argv)
+    for arg in it:
+        if arg == '--shell' or arg == '--prev-shell':
+            flags[arg] = next(it, '')
+        else:
+            rest.append(arg)
+    return rest, flags
+
+
+def _join_shell_flags(rest: List[str], flags: Dict[str, str]) -> List[str]:
+    'The reverse of `_split_shell_flags`, flags with empty values are dropped.'
+    return rest + [item for flag, value in flags.items() if value for item in (flag, value)]
 
 
 def reload_shell(shell: str) -> None:
     'Restart the program and reload to another shell.'
     are_u_sure = input(
-        colored('[ASK]', 'red', attrs=['bold']) + ' Reload shell will discrad all '
+        _TAG_ASK + ' Reload shell will discrad all '
         'local variables, are you sure ([y]/n)? '
     ).strip()
     if are_u_sure not in ('', 'y', 'Y'):
         return
-    argv_ = sys.argv.copy()
-    try:
-        idx = argv_.index('--shell')
-    except ValueError:
+    rest, flags = _split_shell_flags(sys.argv)
+    prev_shell = flags.get('--shell')
+    if prev_shell is None:
         from plugin_util import console
         prev_shell = getattr(console, '__shell__', None)
-        argv_.extend(('--shell', shell))
-    else:
-        prev_shell = argv_[idx + 1]
-        argv_[idx: idx+2] = ['--shell', shell]
+    flags['--shell'] = shell
     if prev_shell:
-        try:
-            idx = argv_.index('--prev-shell')
-        except ValueError:
-            argv_.extend(('--prev-shell', prev_shell))
-        else:
-            argv_[idx: idx+2] = ['--prev-shell', prev_shell]
+        flags['--prev-shell'] = prev_shell
     dump_wrapper()
-    restart_program(argv_)
+    restart_program(_join_shell_flags(rest, flags))
 
 
 def back_shell(argv: List[str] = sys.argv, namespace=None) -> None:
     'back to previous shell (if any)'
-    argv_: List[str] = argv.copy()
-    try:
-        idx: int = argv_.index('--prev-shell')
-    except ValueError:
-        prev_shell = 'python'
-    else:
-        prev_shell = argv_[idx + 1]
-        del argv_[idx: idx + 2]
-    try:
-        idx = argv_.index('--shell')
-    except ValueError:
-        argv_.extend(('--shell', prev_shell))
-    else:
-        argv_[idx: idx + 2] = ['--shell', prev_shell]
-    print(colored('[WARRNING]', 'yellow', attrs=['bold']), 'back to shell:', prev_shell)
+    rest, flags = _split_shell_flags(argv)
+    prev_shell = flags.pop('--prev-shell', None) or 'python'
+    flags['--shell'] = prev_shell
+    print(_TAG_WARNING, 'back to shell:', prev_shell)
     if _SYSTEM_IS_WINDOWS:
         if namespace is None:
             namespace = sys._getframe(1).f_locals
         reload_embeded_shell(prev_shell, namespace=namespace)
     else:
-        restart_program(argv_)
+        restart_program(_join_shell_flags(rest, flags))
 
 
 def reload_embeded_shell(shell, banner='', namespace=None):
@@ -190,17 +303,36 @@ reload_to_shell = reload_embeded_shell if _SYSTEM_IS_WINDOWS else reload_shell
 def run_env(forcible_execution: bool = False, /) -> None:
     'Run env.py, to inject some configuration and global variables'
     if forcible_execution:
-        __import__('builtins')._injectedConsole_RUNPY = False
+        builtins._injectedConsole_RUNPY = False
     run_file(_ENVFILE, sys._getframe(1).f_globals)
 
 
+def _zip_has_main(
+    path: str, 
+    _cache: Dict[Tuple[str, int], bool] = {}, 
+) -> bool:
+    'Check whether the .zip file has __main__.py, cached by (path, mtime).'
+    key = (path, stat(path).st_mtime_ns)
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+    with ZipFile(path) as zf:
+        try:
+            zf.getinfo('__main__.py')
+            has_main = True
+        except KeyError:
+            has_main = False
+    _cache[key] = has_main
+    return has_main
+
+
 def load_script(
     path: str, 
     globals: Optional[dict] = None, 
     include_single: bool = False, 
     include__dunder: bool = False, 
     include__special__: bool = False, 
-    _cre=re.compile('^(?P<special>__.+__)|(?P<dunder>__.*)|(?P<single>_.*)|(?P<normal>.*)$', re.S | re.U), 
 ) -> Optional[dict]:
     '''To execute or register some script.
 
@@ -224,32 +356,36 @@ def load_script(
           all the key-value pairs, their keys are not excluded and their values are different from 
           those of the same key in `globals`, were updated to `globals`.
     '''
-    if not _path.exists(path):
-        raise FileNotFoundError('No such file or directory: %r' % path)
+    # One `stat` call answers both whether it exists and whether it is a folder
+    try:
+        is_dir = S_ISDIR(stat(path).st_mode)
+    except FileNotFoundError:
+        raise FileNotFoundError('No such file or directory: %r' % path) from None
 
     as_sys_path: bool = False
-    if _path.isdir(path):
+    if is_dir:
         as_sys_path = not _path.exists(_path.join(path, '__main__.py'))
     elif path.endswith('.zip'):
-        as_sys_path = '__main__.py' not in ZipFile(path).NameToInfo
+        as_sys_path = not _zip_has_main(path)
 
     if as_sys_path:
-        sys.path.append(path)
+        # Do not let repeated loads grow `sys.path`, every import scans it
+        if path not in sys.path:
+            sys.path.append(path)
         return None
 
     if globals is None:
         globals = sys._getframe(1).f_globals
 
     def check_group(name):
-        group = _cre.fullmatch(name).lastgroup
-        if group == 'single':
+        if not name.startswith('_'):
+            return True
+        elif not name.startswith('__'):
             return include_single
-        elif group == 'dunder':
-            return include__dunder
-        elif group == 'special':
+        elif len(name) > 4 and name.endswith('__'):
             return include__special__
         else:
-            return True
+            return include__dunder
 
     sentinel = object()
     ret: dict = cast(dict, run_path(path, globals, '__main__'))
@@ -277,14 +413,15 @@ def _startup(
         namespace = {}
 
     if startups is None:
-        startups = cast(Tuple[str], tuple(_injectedConsole_CONFIG.get('startup', ())))
-    else:
-        startups = cast(Tuple[str], tuple(startups))
+        startups = _injectedConsole_CONFIG.get('startup') or ()
+    # `len` is needed below, only an iterator has to be collected
+    if not isinstance(startups, (list, tuple)):
+        startups = tuple(startups)
     if not startups:
         return namespace
 
     if errors is None:
-        errors = cast(str, str(_injectedConsole_CONFIG.get('errors', 'ignore')))
+        errors = str(_injectedConsole_CONFIG.get('errors', 'ignore'))
 
     success_count: int = 0
     error_count: int = 0
@@ -293,13 +430,13 @@ def _startup(
         try:
             ret = load_script(path, namespace)
             if ret is None:
-                print(colored('◉ APPENDED', 'yellow', attrs=['bold', 'blink']), '➜', i, path)
+                print(_TAG_APPENDED, '➜', i, path)
             else:
                 keys_updated |= ret.keys()
-                print(colored('◉ LOADED', 'green', attrs=['bold', 'blink']), '➜', i, path)
+                print(_TAG_LOADED, '➜', i, path)
             success_count += 1
         except BaseException:
-            print(colored('◉ ERROR', 'red', attrs=['bold', 'blink']), '➜', i, path)
+            print(_TAG_FAILED, '➜', i, path)
             if errors == 'raise':
                 raise
             print_exc()
@@ -320,7 +457,7 @@ def _startup(
 
     if keys_updated:
         print('The following keys had been updated\n\t|_', tuple(keys_updated))
-        keys_updated_but_removed = keys_updated - namespace.keys()
+        keys_updated_but_removed = {k for k in keys_updated if k not in namespace}
         if keys_updated_but_removed:
             print('But these keys were eventually removed\n\t|_', 
                   tuple(keys_updated_but_removed))
@@ -328,40 +465,90 @@ def _startup(
     return namespace
 
 
-def _run_plugin(file_or_dir: str, bc: BookContainer):
-    container = get_container(deepcopy(bc._w))
+def _read_plugin_type(
+    xml_file: str, 
+    default: str = 'edit', 
+    _cre=re.compile(rb'<type(?:\s[^>]*)?>\s*([^<\s]*)\s*</type>'), 
+    _cache: Dict[Tuple[str, int], Optional[str]] = {}, 
+) -> str:
+    '''Read the text of the `<type>` element in plugin.xml, cached by (path, mtime).
+    plugin.xml is tiny and its `<type>` is a plain word, so a regex usually finds it, 
+    only if not (or the match is empty or inside a comment), the file will be parsed 
+    as XML (stop as soon as `<type>` is found).'''
+    key = (xml_file, stat(xml_file).st_mtime_ns)
+    try:
+        plugin_type = _cache[key]
+    except KeyError:
+        with open(xml_file, 'rb') as f:
+            data = f.read()
+        plugin_type = None
+        match = _cre.search(data)
+        if (
+            match is not None 
+            and match[1] 
+            # Not inside a comment
+            and data.rfind(b'<!--', 0, match.start()) <= data.rfind(b'-->', 0, match.start())
+        ):
+            plugin_type = match[1].decode('utf-8')
+        else:
+            # Imported lazily, only running a plug-in needs an XML parser
+            try:
+                from lxml.etree import iterparse # type: ignore
+            except ImportError:
+                from xml.etree.ElementTree import iterparse
+            for _, elem in iterparse(xml_file, events=('end',)):
+                if elem.tag == 'type':
+                    # An empty type is kept, to be rejected by the caller
+                    plugin_type = elem.text or ''
+                    break
+                elem.clear()
+        _cache[key] = plugin_type
+    return default if plugin_type is None else plugin_type
 
+
+def _run_plugin(file_or_dir: str, bc: BookContainer):
     target_dir: str
     target_file: str
-    if _path.isdir(file_or_dir):
-        target_dir = file_or_dir
-        target_file = _path.join(file_or_dir, 'plugin.py')
-    else:
+    # One `scandir` call both tells whether it is a directory and lists the 
+    # directory, so that a missing plugin.xml does not cost another syscall
+    try:
+        with scandir(file_or_dir) as it:
+            names = {entry.name for entry in it}
+    except NotADirectoryError:
         target_file = file_or_dir
         target_dir = _path.dirname(target_file)
+        names = None
+    else:
+        target_dir = file_or_dir
+        target_file = _path.join(file_or_dir, 'plugin.py')
 
-    try:
-        et = parse_xml_file(_path.join(target_dir, 'plugin.xml'))
-    except FileNotFoundError:
+    if names is not None and 'plugin.xml' not in names:
         plugin_type = 'edit'
     else:
-        plugin_type = et.findtext('type', 'edit')
+        try:
+            plugin_type = _read_plugin_type(_path.join(target_dir, 'plugin.xml'))
+        except FileNotFoundError:
+            plugin_type = 'edit'
 
-    if plugin_type not in ('edit', 'input', 'validation', 'output'):
+    try:
+        container_type = _CONTAINER_TYPES[plugin_type]
+    except KeyError:
         raise ValueError(
             'Invalid plugin type %r' % plugin_type
         ) from NotImplementedError
 
+    # A pickle round-trip runs in C and is much cheaper than `deepcopy` 
+    # for the dict-heavy graph of a `Wrapper`
+    # NOTE: Only the container of `plugin_type` is needed
+    bk = container_type(pickle_loads(pickle_dumps(bc._w, HIGHEST_PROTOCOL)))
+
     with ctx_load(
             target_file, 
             wdir=target_dir, 
-            prefixes_not_clean=(
-                *set(__import__('site').PREFIXES), 
-                _injectedConsole_PATH['sigil_package_dir'], 
-            ), 
+            prefixes_not_clean=_PREFIXES_NOT_CLEAN, 
         ) as mod, \
         temp_list(sys.argv) as av, \
-        _ctx_wrapper() \
+        _ctx_wrapper(persist=False) \
     :
         sys.modules['__main__'] = __import__('launcher')
         sys.modules[getattr(mod, '__name__')] = mod
@@ -370,17 +557,20 @@ def _run_plugin(file_or_dir: str, bc: BookContainer):
                  _injectedConsole_PATH['outdir'], 
                  plugin_type, target_file]
 
-        bk = container[plugin_type]
         try:
             ret = getattr(mod, 'run')(bk)
-            if ret == 0 or type(ret) is not int:
-                dump_wrapper(bk._w)
+            if plugin_type in ('output', 'validation'):
+                # Like Sigil, discard changes of the plugins that are not 
+                # allowed to change the book
+                pass
+            elif ret == 0 or type(ret) is not int:
+                _install_wrapper(bk._w)
             else:
                 # Restore to unmodified (no guarantee of right result)
-                dump_wrapper(bc._w)
+                _install_wrapper(bc._w)
         except BaseException:
             # Restore to unmodified (no guarantee of right result)
-            dump_wrapper(bc._w)
+            _install_wrapper(bc._w)
             raise
         return ret
 
@@ -392,6 +582,8 @@ def run_plugin(
     executable: str = sys.executable,
 ):
     '''Running a Sigil plug-in
+    NOTE: Like Sigil, the changes made by an 'output' or 'validation' plug-in 
+          are discarded, they are not allowed to change the book.
 
     :param file_or_dir: Path of Sigil plug-in folder or script file.
     :param bc: `BookContainer` object. 
@@ -409,35 +601,14 @@ def run_plugin(
     file_or_dir = _path.abspath(file_or_dir)
 
     if run_in_process:
-        with NamedTemporaryFile(suffix='.py', mode='w', encoding='utf-8') as f, _ctx_wrapper():
-            f.write(
-f'''#!/usr/bin/env python3
-# coding: utf-8
-
-exec(open(r'{_ENVFILE}', encoding='utf-8').read(), globals())
-
-try:
-    retcode = __import__('plugin_help').function._run_plugin(r'{file_or_dir}', bc)
-    print("plugin %r \\n\\t |_ return ➜ %r" % (r'{file_or_dir}', retcode))
-    if type(retcode) is not int:
-        retcode = 0
-except BaseException:
-    retcode = -1
-
-if retcode != 0:
-    __import__('atexit').unregister(plugin.dump_wrapper)
-    __import__('os')._exit(retcode)
-''')
-            f.flush()
+        with _ctx_wrapper():
             return subprocess.run(
-                [executable, f.name], 
-                check=True, shell=_SYSTEM_IS_WINDOWS)
+                [executable, _CHILD_LAUNCHER, file_or_dir], 
+                env={**environ, 'INJCONSOLE_ENVFILE': _ENVFILE}, 
+                check=True)
     else:
         if bc is None:
-            try:
-                bc = cast(BookContainer, sys._getframe(1).f_globals['bc'])
-            except KeyError:
-                bc = cast(BookContainer, _EDIT_CONTAINER)
+            bc = cast(BookContainer, sys._getframe(1).f_globals.get('bc', _EDIT_CONTAINER))
 
         return _run_plugin(file_or_dir, bc)
 
@@ -489,7 +660,7 @@ def start_qtconsole(
     _ensure_pyqt5()
     if not args:
         args = ('--FrontendWidget.banner=⏰ RUN COMMAND FIRST\n\t%s\n\n' 
-                % colored('%run env', 'red', attrs=['bold', 'blink']),)
+                % _RUN_ENV_TIP,)
     with _ctx_wrapper():
         _run_env_tips('qtconsole')
         return prun_module(
@@ -508,7 +679,7 @@ def start_spyder(
         args = ('-w', _OUTDIR, '--window-title', 'RUN FIRST ➜ %run env')
     if 'env' in prun_kwds:
         env = prun_kwds['env']
-        env.update((k, v) for k, v in environ.items() if k not in env)
+        env.update({k: v for k, v in environ.items() if k not in env})
     else:
         env = prun_kwds.setdefault('env', environ.copy())
     if _SYSTEM_IS_WINDOWS:
@@ -579,7 +750,7 @@ def start_python_shell(
         start_specific_python_console(namespace, banner, shell)
         dump_wrapper()
     except BaseException:
-        print(colored('[ERROR]', 'red', attrs=['bold']))
+        print(_TAG_ERROR)
         print_exc()
         if _SYSTEM_IS_WINDOWS:
             reload_embeded_shell('python', banner, namespace)
@@ -19,7 +19,9 @@ ap.add_argument(
 )
 args = ap.parse_args()
 
-if __import__('platform').system() == 'Linux':
+from plugin_util.platform_const import IS_LINUX
+
+if IS_LINUX:
     from plugin_util.terminal import _send_pid_to_server
     _send_pid_to_server()
 
@@ -29,7 +31,8 @@ from typing import Final, Mapping
 from types import MappingProxyType
 
 
-_injectedConsole_CONFIG: Final[dict] = __import__('json').load(open(args.args))
+with open(args.args, encoding='utf-8') as f:
+    _injectedConsole_CONFIG: Final[dict] = __import__('json').load(f)
 _injectedConsole_PATH: Final[Mapping[str, str]] = MappingProxyType(_injectedConsole_CONFIG['path'])
 setattr(builtins, '_injectedConsole_CONFIG', _injectedConsole_CONFIG)
 setattr(builtins, '_injectedConsole_PATH', _injectedConsole_PATH)
@@ -42,16 +45,14 @@ from plugin_help import function
 os.environ['env'] = function._ENVFILE
 
 shell: str = args.shell
-if shell == 'nbterm':
-    function.start_nbterm()
-elif shell == 'qtconsole':
-    function.start_qtconsole()
-elif shell == 'spyder':
-    function.start_spyder()
-elif shell == 'jupyter notebook':
-    function.start_jupyter_notebook()
-elif shell == 'jupyter lab':
-    function.start_jupyter_lab()
-else:
+start = {
+    'nbterm': function.start_nbterm, 
+    'qtconsole': function.start_qtconsole, 
+    'spyder': function.start_spyder, 
+    'jupyter notebook': function.start_jupyter_notebook, 
+    'jupyter lab': function.start_jupyter_lab, 
+}.get(shell)
+if start is None:
     function.start_python_shell(shell)
-
+else:
+    start()
@@ -11,17 +11,19 @@ import json
 import sys
 
 from contextlib import contextmanager
+from functools import lru_cache
 from importlib import import_module
 from os import path
 from typing import Final, Optional, Tuple
 from types import MappingProxyType
 
+from plugin_util.platform_const import IS_MACOS as _IS_MACOS
 from plugin_util.run import run_in_process
 
 
-_IS_MACOS = __import__('platform').system() == 'Darwin'
 MUDULE_DIR: Final[str] = path.dirname(path.abspath(__file__))
 CONFIG_JSON_FILE: Final[str] = path.join(MUDULE_DIR, 'config.json')
+MAIN_FILE: Final[str] = path.join(MUDULE_DIR, 'plugin_main.py')
 SHELLS: Final[Tuple[str, ...]] = (
     'python',
     'ipython',
@@ -35,11 +37,59 @@ SHELLS: Final[Tuple[str, ...]] = (
     'jupyter notebook',
 )
 
+# Template of the environment initialization script `env.py`
+_ENV_TEMPLATE: Final[str] = '''#!/usr/bin/env python3
+# coding: utf-8
+import builtins as __builtins
+
+if getattr(__builtins, '_injectedConsole_RUNPY', False):
+    print("""
+    🦶🦶🦶 Environment had been loaded, ignoring
+    🏃🏃🏃 环境早已被加载，忽略
+""")
+else:
+    # Injecting builtins variable: _injectedConsole_PATH
+    __builtins._injectedConsole_PATH = __import__('types').MappingProxyType({pathes_repr})
+    # Injecting builtins variable: _injectedConsole_CONFIG
+    __builtins._injectedConsole_CONFIG = __import__('json').loads({config_json_repr})
+
+    # Injecting module pathes
+    __sys_path = __import__('sys').path
+    __sys_path.insert(0, r'{this_plugin_dir}')
+    __sys_path.insert(0, r'{sigil_package_dir}')
+    del __sys_path
+
+    __import__('os').chdir(r'{outdir}')
+
+    # Introducing global variables
+    import plugin_help as plugin
+    w = wrapper = plugin.function._WRAPPER
+    container = plugin.get_container(wrapper)
+    bc = bk = bookcontainer = container.edit
+
+    # Callback at exit
+    __import__('atexit').register(plugin.dump_wrapper, force=False)
 
-def _import_all(mod_name):
+    # Perform startup scripts
+    plugin.function._startup(globals())
+
+    # Execution success information
+    print("""
+    🎉🎉🎉 Environment loaded successfully
+    🎆🎆🎆 成功加载环境
+""")
+    __builtins._injectedConsole_RUNPY = True
+
+del __builtins
+'''
+
+
+@lru_cache(maxsize=None)
+def _import_all(mod_name) -> MappingProxyType:
+    'Collect the names in `__all__` of the module (cached, so the result is read-only).'
     mod = import_module(mod_name)
     get = mod.__dict__.get
-    return {k: get(k) for k in mod.__all__}
+    return MappingProxyType({k: get(k) for k in mod.__all__})
 
 
 '''
@@ -58,11 +108,18 @@ def _ctx_conifg():
 '''
 
 
+def _config_sig(config) -> str:
+    'A canonical json dump of `config`, to tell whether it has been changed.'
+    return json.dumps(config, sort_keys=True, separators=(',', ':'), default=repr)
+
+
 @contextmanager
 def _ctx_conifg(bc):
     config = bc.getPrefs()
+    sig = _config_sig(config)
     yield config
-    bc.savePrefs(config)
+    if _config_sig(config) != sig:
+        bc.savePrefs(config)
 
 
 def update_config_webui() -> dict:
@@ -95,8 +152,11 @@ def update_config_gui_tk(
             config['config'] = {'shell': 'python', 'errors': 'ignore', 'startup': []}
         if 'configs' not in config:
             config['configs'] = []
-        namespace = _import_all('plugin_util.tkinter_extensions')
-        namespace.update(config=config, SHELLS=SHELLS)
+        namespace = {
+            **_import_all('plugin_util.tkinter_extensions'), 
+            'config': config, 
+            'SHELLS': SHELLS, 
+        }
 
         tkapp = TkinterXMLConfigParser(
             path.join(MUDULE_DIR, 'plugin_src', 'config.xml'), namespace)
@@ -129,61 +189,25 @@ def run(bc) -> Optional[int]:
     setattr(builtins, '_injectedConsole_PATH', MappingProxyType(pathes))
     setattr(builtins, '_injectedConsole_CONFIG', config)
 
-    abortfile    = path.join(outdir, 'abort.exists')
-    envfile      = path.join(outdir, 'env.py')
-    argsfile     = path.join(outdir, 'args.pkl')
-    mainfile     = path.join(this_plugin_dir, 'plugin_main.py')
-
     from plugin_help import function
 
+    # Reuse the paths that `function` has already joined at import
+    abortfile = function._ABORTFILE
+    envfile   = function._ENVFILE
+
     function._WRAPPER = bc._w
     function.dump_wrapper(bc._w)
 
-    open(envfile, 'w', encoding='utf-8').write(
-f'''#!/usr/bin/env python3
-# coding: utf-8
-import builtins as __builtins
-
-if getattr(__builtins, '_injectedConsole_RUNPY', False):
-    print("""
-    🦶🦶🦶 Environment had been loaded, ignoring
-    🏃🏃🏃 环境早已被加载，忽略
-""")
-else:
-    # Injecting builtins variable: _injectedConsole_PATH
-    __builtins._injectedConsole_PATH = __import__('types').MappingProxyType({pathes!r})
-    # Injecting builtins variable: _injectedConsole_CONFIG
-    __builtins._injectedConsole_CONFIG = __import__('json').loads({json.dumps(config)!r})
-
-    # Injecting module pathes
-    __sys_path = __import__('sys').path
-    __sys_path.insert(0, r'{this_plugin_dir}')
-    __sys_path.insert(0, r'{sigil_package_dir}')
-    del __sys_path
-
-    __import__('os').chdir(r'{outdir}')
-
-    # Introducing global variables
-    import plugin_help as plugin
-    w = wrapper = plugin.function._WRAPPER
-    container = plugin.get_container(wrapper)
-    bc = bk = bookcontainer = container.edit
-
-    # Callback at exit
-    __import__('atexit').register(plugin.dump_wrapper)
-
-    # Perform startup scripts
-    plugin.function._startup(globals())
-
-    # Execution success information
-    print("""
-    🎉🎉🎉 Environment loaded successfully
-    🎆🎆🎆 成功加载环境
-""")
-    __builtins._injectedConsole_RUNPY = True
-
-del __builtins
-''')
+    # Serialize once, for both env.py and args.json
+    config_json = json.dumps(config, separators=(',', ':'))
+    with open(envfile, 'w', encoding='utf-8') as f:
+        f.write(_ENV_TEMPLATE.format_map({
+            'pathes_repr': repr(pathes), 
+            'config_json_repr': repr(config_json), 
+            'this_plugin_dir': this_plugin_dir, 
+            'sigil_package_dir': sigil_package_dir, 
+            'outdir': outdir, 
+        }))
     print('WARNING:', 'Created environment initialization script file\n%r\n' %envfile)
 
     __import__('os').chdir(outdir)
@@ -196,8 +220,10 @@ del __builtins
     else:
         from plugin_util.terminal import start_terminal
 
-        json.dump(config, open(argsfile, 'w'))
-        args = [sys.executable, mainfile, '--args', argsfile]
+        argsfile = path.join(outdir, 'args.json')
+        with open(argsfile, 'w', encoding='utf-8') as f:
+            f.write(config_json)
+        args = [sys.executable, MAIN_FILE, '--args', argsfile]
         if shell:
             args.extend(('--shell', shell))
         kwds = {}
@@ -24,11 +24,13 @@ __all__ = ['ElementTree', 'Element', 'HTMLParser', 'make_element',
 import re
 import warnings
 
+from codecs import getincrementaldecoder
+from contextlib import nullcontext
 from html.parser import HTMLParser as _HTMLParser
 from html.entities import name2codepoint
 from os import PathLike
 from typing import (
-    cast, Any, BinaryIO, Dict, List, Optional, Tuple, 
+    cast, Any, BinaryIO, Callable, Dict, Final, List, Optional, Tuple, 
     Sequence, TextIO, Union, 
 )
 from xml.etree.ElementTree import (
@@ -40,6 +42,19 @@ from xml.etree.ElementTree import (
 # Add missing codepoints
 name2codepoint["apos"] = 0x0027
 
+# Some tags in html do not require closing tags so thoes tags will need to be auto closed (Void elements)
+# Refer to: https://www.w3.org/TR/html/syntax.html#void-elements
+_VOID_ELEMENTS: Final[frozenset] = frozenset((
+    "area", "base", "br", "col", "hr", "img", "input", "link", "meta", "param",
+    # Only in HTML5
+    "embed", "keygen", "source", "track",
+    # Not supported in HTML5
+    "basefont", "frame", "isindex",
+    # SVG self closing tags
+    "rect", "circle", "ellipse", "line", "polyline", "polygon",
+    "path", "stop", "use", "image", "animatetransform", 
+))
+
 PathType = Union[str, bytes, PathLike]
 HandledAttrType = List[Tuple[str, Optional[str]]]
 
@@ -54,6 +69,39 @@ def _ensure_bytes(o: Any) -> bytes:
         return bytes(o)
 
 
+# The bytes that may follow the tag name in `<meta`
+_META_NAME_END: Final[frozenset] = frozenset((b' ', b'\t', b'\n', b'\r', b'\f', b'/', b'>'))
+
+
+def _find_meta_charset(
+    data: bytes, 
+    end: int, 
+    _cre=re.compile(br"""[\s'"]*([^\s'">;/]+)"""), 
+) -> Optional[str]:
+    """Find the value of `charset=` in a `<meta>` tag within *data[:end]*.
+
+    NOTE: The scan is done by `bytes.find` (case sensitive) without copying *data*, 
+          the caller may fall back to a case insensitive regular expression.
+    """
+    find, rfind = data.find, data.rfind
+    start = 0
+    while (idx := find(b'charset=', start, end)) != -1:
+        start = idx + 8
+        # The nearest tag before must be an unclosed `<meta` (but not e.g. `<metadata`)
+        lt = rfind(b'<', 0, idx)
+        if (
+            lt == -1 
+            or data[lt+1:lt+5].lower() != b'meta' 
+            or data[lt+5:lt+6] not in _META_NAME_END 
+            or find(b'>', lt, idx) != -1
+        ):
+            continue
+        value = _cre.match(data, start, end)
+        if value:
+            return value.group(1).decode('latin-1')
+    return None
+
+
 class ElementTree(_ElementTree):
 
     _root: Optional[Element]   = None
@@ -129,16 +177,8 @@ class HTMLParser(_HTMLParser):
         self.encoding: Optional[str] = encoding
         self._init_attrs: Dict[str, str] = {} if attrs is None else attrs
 
-        # Some tags in html do not require closing tags so thoes tags will need to be auto closed (Void elements)
-        # Refer to: https://www.w3.org/TR/html/syntax.html#void-elements
-        self._voids = frozenset(("area", "base", "br", "col", "hr", "img", "input", "link", "meta", "param",
-                                 # Only in HTML5
-                                 "embed", "keygen", "source", "track",
-                                 # Not supported in HTML5
-                                 "basefont", "frame", "isindex",
-                                 # SVG self closing tags
-                                 "rect", "circle", "ellipse", "line", "polyline", "polygon",
-                                 "path", "stop", "use", "image", "animatetransform"))
+        # NOTE: Kept as an instance attribute, `tag in self._voids` is checked for every tag
+        self._voids = _VOID_ELEMENTS
 
         self._init()
 
@@ -146,20 +186,17 @@ class HTMLParser(_HTMLParser):
         self._root: Optional[Element] = None  # root element
         self._data: list = []  # data collector
         self._enabled: bool = not self.tag # top level tag flag
-        self._unw_attrs: list = []
         self._finished: bool = False
         self._roottree: ElementTree = ElementTree(None)
         self._roottree.encoding = self.encoding
         self._doctype: Optional[str] = None
         self._xmlinfo: Optional[Element] = None
+        self._decode: Optional[Callable[..., str]] = None
 
-        attrs = self.attrs = self._init_attrs.copy()
         # Split attributes into wanted and unwanted attributes
-        if attrs:
-            for key, value in self._init_attrs.items():
-                if value == 0:
-                    self._unw_attrs.append(key)
-                    del attrs[key]
+        init_attrs = self._init_attrs
+        self.attrs = {k: v for k, v in init_attrs.items() if v != 0}
+        self._unw_attrs: frozenset = frozenset(k for k, v in init_attrs.items() if v == 0)
 
         # Create temporary root element to protect from badly written sites that either
         # have no html starting tag or multiple top level elements
@@ -169,45 +206,51 @@ class HTMLParser(_HTMLParser):
         self._last: Element = elem
         self._tail: int = 0
 
-    def _make_unicode(
+    def _detect_encoding(
         self, 
         data: bytes, 
-        _cre=re.compile(b'<meta.+?charset=[\'"]*(.+?)["\'].*?>', re.IGNORECASE), 
+        _cre=re.compile(br'''<meta[\s/][^>]*?charset=['"]?([^'">;/\s]+)''', re.IGNORECASE), 
     ) -> str:
         """
-        Convert *data* from type :class:`bytes` to type :class:`str`.
+        Determine the encoding of *data*, and set it to `self.encoding`.
 
-        :param data: The html document.
+        :param data: The html document (or its first chunk).
         :type data: bytes
 
-        :return: HTML data decoded.
+        :return: The encoding.
         :rtype: str
         """
         # Atemp to find the encoding from the html source
         if self._xmlinfo and self._xmlinfo.attrib.get('encoding'):
             self._roottree.encoding = self.encoding = cast(str, self._xmlinfo.attrib['encoding'])
-            return data.decode(self.encoding)
+            return self.encoding
+        # Search for the charset attribute within the meta tags (before `</head>`, if any)
         end_head_tag = data.find(b"</head>")
-        if end_head_tag:
-            # Search for the charset attribute within the meta tags
-            charset = _cre.search(data[:end_head_tag])
+        if end_head_tag == -1:
+            end_head_tag = len(data)
+        encoding = _find_meta_charset(data, end_head_tag)
+        if not encoding:
+            charset = _cre.search(data, 0, end_head_tag)
             if charset:
-                self._roottree.encoding = self.encoding = cast(str, charset.group(1).decode())
-                return data.decode(self.encoding)
+                encoding = charset.group(1).decode()
+        if encoding:
+            self._roottree.encoding = self.encoding = encoding
+            return encoding
 
-        # Decode the string into unicode using default encoding
+        # Use default encoding
         warn_msg = "Unable to determine encoding, defaulting to iso-8859-1"
-        warnings.warn(warn_msg, UnicodeWarning, stacklevel=2)
-        self.encoding = "iso-8859-1"
-        return data.decode("iso-8859-1")
+        warnings.warn(warn_msg, UnicodeWarning, stacklevel=3)
+        self._roottree.encoding = self.encoding = "iso-8859-1"
+        return "iso-8859-1"
 
     def feed(self, data: Union[bytes, str]) -> None:
         """
         Feeds data to the parser.
 
         If *data*, is of type :class:`bytes` and where no encoding was specified, then the encoding
-        will be extracted from *data* using "meta tags", if available.
-        Otherwise encoding will default to "ISO-8859-1"
+        will be extracted from *data* (the first chunk) using "meta tags", if available.
+        Otherwise encoding will default to "ISO-8859-1". The chunks are decoded incrementally, 
+        so a multibyte character can be split between chunks.
 
         :param data: HTML data
         :type data: str or bytes
@@ -220,10 +263,12 @@ class HTMLParser(_HTMLParser):
 
         # Make sure that we have unicode before continuing
         if isinstance(data, bytes):
-            if self.encoding:
-                data = data.decode(self.encoding)
-            else:
-                data = self._make_unicode(data)
+            decode = self._decode
+            if decode is None:
+                # Determine the encoding only once, then keep the decoder
+                decode = self._decode = getincrementaldecoder(
+                    self.encoding or self._detect_encoding(data))().decode
+            data = decode(data)
 
         # Parse the html document
         try:
@@ -251,10 +296,10 @@ class HTMLParser(_HTMLParser):
             self._roottree.xmlinfo = self._xmlinfo = pi
 
     def handle_starttag(self, tag: str, attrs: HandledAttrType) -> None:
-        self._handle_starttag(tag, attrs, self_closing=tag in self._voids)
+        self._handle_starttag(tag, attrs, tag in self._voids)
 
     def handle_startendtag(self, tag: str, attrs: HandledAttrType) -> None:
-        self._handle_starttag(tag, attrs, self_closing=True)
+        self._handle_starttag(tag, attrs, True)
 
     def _handle_starttag(
         self, 
@@ -264,21 +309,22 @@ class HTMLParser(_HTMLParser):
     ) -> None:
         # Add tag element to tree if we have no filter or that the filter matches
         if self._enabled or self._search(tag, attrs):
-            # Convert attrs to dictionary
-            attrs_: dict = dict(attrs) if attrs else {}
-            self._flush()
+            if self._data:
+                self._flush()
 
-            # Create the new element
-            elem = Element(tag, attrs_)
-            elem.roottree = self._roottree
-            self._elem[-1].append(elem)
+            # Create the new element (attrs are converted to dictionary), 
+            # NOTE: Set `_roottree` directly, bypassing the property setter
+            elem = Element(tag, dict(attrs))
+            elem._roottree = self._roottree
+            _elem = self._elem
+            _elem[-1].append(elem)
             self._last = elem
 
             # Only append the element to the list of elements if it's not a self closing element
             if self_closing:
                 self._tail = 1
             else:
-                self._elem.append(elem)
+                _elem.append(elem)
                 self._tail = 0
 
             # Set this element as the root element when the filter search matches
@@ -293,7 +339,8 @@ class HTMLParser(_HTMLParser):
             _root = self._root
             # Check that the closing tag is what's actualy expected
             if _elem[-1].tag == tag:
-                self._flush()
+                if self._data:
+                    self._flush()
                 self._tail = 1
                 self._last = elem = _elem.pop()
                 if elem is _root:
@@ -302,7 +349,8 @@ class HTMLParser(_HTMLParser):
             # If the previous element is what we actually have then the expected element was not
             # properly closed so we must close that before closing what we have now
             elif len(_elem) >= 2 and _elem[-2].tag == tag:
-                self._flush()
+                if self._data:
+                    self._flush()
                 self._tail = 1
                 for _ in range(2):
                     self._last = elem = _elem.pop()
@@ -364,6 +412,11 @@ class HTMLParser(_HTMLParser):
 
     def close(self) -> Optional[Element]: # type: ignore
         try:
+            if self._decode is not None:
+                # Flush the decoder, it raises if an incomplete character remains
+                data = self._decode(b'', True)
+                if data:
+                    self.feed(data)
             return self._close()
         finally:
             self._init()
@@ -381,12 +434,15 @@ class HTMLParser(_HTMLParser):
     def _search(self, tag: str, attrs: HandledAttrType) -> bool:
         # Only search when the tag matches
         if tag == self.tag:
+            wanted_attrs = self.attrs
+            unwanted_attrs = self._unw_attrs
             # If we have required attrs to match then search all attrs for wanted attrs
             # And also check that we do not have any attrs that are unwanted
-            if self.attrs or self._unw_attrs:
+            if wanted_attrs or unwanted_attrs:
                 if attrs:
-                    wanted_attrs = self.attrs.copy()
-                    unwanted_attrs = self._unw_attrs
+                    # Names of the wanted attrs that have been found, 
+                    # only allocated when the first one is found
+                    found: Optional[set] = None
                     for key, value in attrs:
                         # Check for unwanted attrs
                         if key in unwanted_attrs:
@@ -396,13 +452,13 @@ class HTMLParser(_HTMLParser):
                         elif key in wanted_attrs:
                             c_value = wanted_attrs[key]
                             if c_value == value or c_value == 1:
-                                # Remove this attribute from the wanted dict of attributes
-                                # to indicate that this attribute has been found
-                                del wanted_attrs[key]
+                                if found is None:
+                                    found = {key}
+                                else:
+                                    found.add(key)
 
-                    # If wanted_attrs is now empty then all attributes must have been found
-                    if not wanted_attrs:
-                        return True
+                    # If all wanted attrs have been found (attrs may repeat, so count by names)
+                    return (len(found) if found else 0) == len(wanted_attrs)
             else:
                 # We only need to match tag
                 return True
@@ -502,18 +558,24 @@ def parse(
     # Assume that source is a file-like object if the 'read' methods is found
     if hasattr(source, 'read'):
         source = cast(Union[BinaryIO, TextIO], source)
+        ctx = nullcontext(source)
     else:
         source = cast(PathLike, source)
-        source = cast(BinaryIO, open(source, 'rb', encoding=encoding))
+        ctx = source = cast(BinaryIO, open(source, 'rb'))
 
     if parser is None:
-        parser = HTMLParser()
-
-    # Read in 64k at a time
-    data: Union[bytes, str]
-    while (data := source.read(65536)):
-        # Feed the parser
-        parser.feed(data)
+        parser = HTMLParser(encoding=encoding)
+    elif encoding:
+        parser._roottree.encoding = parser.encoding = encoding
+
+    with ctx:
+        # Read in (up to) 64k at a time, `read1` returns what is available 
+        # without waiting to fill the whole chunk
+        read = getattr(source, 'read1', source.read)
+        data: Union[bytes, str]
+        while (data := read(65536)):
+            # Feed the parser (it decodes bytes incrementally)
+            parser.feed(data)
 
     # Return the root element
     return parser.close()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+__author__  = 'ChenyangGao <https://chenyanggao.github.io/>'
+__version__ = (0, 0, 1)
+__all__ = ['SYSTEM', 'IS_WINDOWS', 'IS_MACOS', 'IS_LINUX']
+
+# NOTE: Use `sys.platform` (a constant), rather than `platform.system()`, 
+#       which needs to import `platform` and call `uname()`.
+from sys import platform as _platform
+from typing import Final
+
+
+IS_WINDOWS: Final[bool] = _platform == 'win32'
+IS_MACOS: Final[bool] = _platform == 'darwin'
+IS_LINUX: Final[bool] = _platform.startswith('linux')
+# Named like the return value of `platform.system()`
+SYSTEM: Final[str] = (
+    'Windows' if IS_WINDOWS else 
+    'Darwin' if IS_MACOS else 
+    'Linux' if IS_LINUX else 
+    _platform
+)
@@ -11,30 +11,30 @@ import errno
 import inspect
 import multiprocessing
 import re
+import signal
 import subprocess
 import sys
+import threading
 
 from contextlib import contextmanager
 from functools import partial
-from os import execl, getcwd, kill, path as _path
+from os import execv, getcwd, kill, path as _path
 from runpy import run_path
 from sys import argv, executable
 from time import sleep
 from typing import (
-    Any, Callable, Dict, Final, Generator, Optional, Tuple, Type, Union
+    Any, Callable, Dict, Generator, Optional, Tuple, Type, Union
 )
 from types import CodeType, ModuleType
 from urllib.parse import unquote
 from urllib.request import urlopen, Request
 
 from .cm import ensure_cm
+from .platform_const import IS_WINDOWS as _PLATFORM_IS_WINDOWS
 from .temporary import temp_wdir, temp_sys_modules, _PREFIXES
 from .undefined import undefined 
 
 
-_PLATFORM_IS_WINDOWS: Final[bool] = __import__('platform').system() == 'Windows'
-
-
 def _startswith_protocol(
     path: Union[bytes, str], 
     _cre=re.compile('^[_a-zA-Z][_a-zA-Z0-9]+://'),
@@ -125,7 +125,7 @@ def run_in_process(fn: Callable, /, *args, **kwargs):
 
 def restart_program(argv=argv):
     'restart the program'
-    execl(executable, executable, *argv)
+    execv(executable, [executable, *argv])
 
 
 def run_file(
@@ -225,7 +225,8 @@ def ctx_run(
             module_name = _path.splitext(_path.basename(path))[0]
             package_name = ''
 
-        source = open(file_, encoding='utf-8').read()
+        with open(file_, encoding='utf-8') as f:
+            source = f.read()
 
     if namespace is None:
         namespace = {'__name__': module_name}
@@ -304,6 +305,33 @@ def load(*args, **kwargs):
         return mod
 
 
+@contextmanager
+def _ctx_ignore_sigint() -> Generator[None, None, None]:
+    '''Ignore Ctrl-C (SIGINT) in the current process temporarily, so that only 
+    the child process (which shares the console) will handle it.
+
+    NOTE: Enter it after the child process has been created, otherwise the 
+          child process will inherit the ignoring.
+    '''
+    if _PLATFORM_IS_WINDOWS:
+        set_handler = __import__('ctypes').windll.kernel32.SetConsoleCtrlHandler
+        set_handler(None, True)
+        try:
+            yield
+        finally:
+            set_handler(None, False)
+    elif threading.current_thread() is threading.main_thread():
+        handler = signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            yield
+        finally:
+            signal.signal(signal.SIGINT, handler)
+    else:
+        # Signal handlers can only be set in the main thread, and only
+        # the main thread receives KeyboardInterrupt.
+        yield
+
+
 def prun(
     *popenargs,
     input: Optional[bytes] = None, 
@@ -323,6 +351,8 @@ def prun(
 
     When a exception occurs, if type of the exception is contained in `continue_with_exceptions`, 
     the program will ignore the exception and continue to execute.
+    If `KeyboardInterrupt` is contained in `continue_with_exceptions`, Ctrl-C will be ignored by 
+    the current process while waiting, and only the child process will handle it.
 
     If check is True and the exit code was non-zero, it raises a
     CalledProcessError. The CalledProcessError object will have the return code
@@ -357,7 +387,14 @@ def prun(
         kwargs['stdout'] = subprocess.PIPE
         kwargs['stderr'] = subprocess.PIPE
 
-    with subprocess.Popen(*popenargs, **kwargs) as process:
+    if not isinstance(continue_with_exceptions, tuple):
+        continue_with_exceptions = continue_with_exceptions,
+    ignore_sigint: bool = any(
+        issubclass(KeyboardInterrupt, exc_type) for exc_type in continue_with_exceptions)
+
+    with subprocess.Popen(*popenargs, **kwargs) as process, \
+        ensure_cm(_ctx_ignore_sigint() if ignore_sigint else None) \
+    :
         while True:
             try:
                 stdout, stderr = process.communicate(input, timeout=timeout)
@@ -394,10 +431,22 @@ def prun_module(
     *args: str,
     executable: str = executable,
     continue_with_exceptions=KeyboardInterrupt,
-    shell=_PLATFORM_IS_WINDOWS,
+    shell=False,
     **prun_kwds,
 ) -> subprocess.CompletedProcess:
-    'Run library module as a script with `prun` function.'
+    '''Run library module as a script with `prun` function.
+
+    NOTE: The command is a list whose first item is an absolute path of the 
+          Python executable, so it does not need a shell (also on Windows), 
+          starting a shell would only add an extra `cmd.exe` process.
+    NOTE: On POSIX, `close_fds` defaults to False, so that `subprocess` can start 
+          the child with `posix_spawn` (if available) instead of `fork` + `exec`, 
+          forking would copy the page tables of this (maybe very large) process.
+          File descriptors are non-inheritable by default (PEP 446), so the 
+          child will not inherit them anyway.
+    '''
+    if not _PLATFORM_IS_WINDOWS:
+        prun_kwds.setdefault('close_fds', False)
     return prun([executable, '-m', mod, *args], 
                 continue_with_exceptions=continue_with_exceptions, 
                 shell=shell, **prun_kwds)
@@ -7,15 +7,14 @@ __all__ = ['exists_execfile', 'list_debian_apps', 'get_debian_default_app',
            'set_debian_default_app']
 
 
-from subprocess import run as sprun, DEVNULL, PIPE
+from shutil import which
+from subprocess import run as sprun, PIPE
 from typing import List, Optional
 
 
 def exists_execfile(file: str) -> bool:
     'Check whether the executable file exists in a directory in $PATH.'
-    return sprun(
-        ['which', file], stdout=DEVNULL, stderr=DEVNULL
-    ).returncode == 0
+    return which(file) is not None
 
 
 def list_debian_apps(field: str) -> Optional[List[str]]:
@@ -198,7 +198,7 @@ def temp_dir(path: Optional[PathType] = None):
 @contextmanager
 def temp_file(path: Optional[PathType] = None):
     if path is not None:
-        open(path, 'x+b')
+        open(path, 'x+b').close()
         try:
             yield path
         finally:
@@ -21,6 +21,7 @@ from contextlib import contextmanager
 from enum import Enum
 from os import getcwd, getpid, remove, path as _path
 from shlex import quote as shlex_quote, split as shlex_split
+from shutil import which
 from subprocess import run as sprun, CompletedProcess
 from tempfile import NamedTemporaryFile
 from typing import (
@@ -28,6 +29,7 @@ from typing import (
 )
 
 from .cm import ensure_cm
+from .platform_const import SYSTEM as _PLATFORM, IS_WINDOWS, IS_MACOS, IS_LINUX
 from .shell_util import exists_execfile
 from .run import wait_for_pid
 from .decorator import as_thread, suppressed, expand_by_args
@@ -48,7 +50,6 @@ __all__ = ['start_terminal', 'shlex_quote', 'shlex_join', 'winsh_quote', 'winsh_
 
 _CURDIR: Final[str] = getcwd()
 _ENV_WAIT_PID_FILE = _path.join(_CURDIR, 'env_wait_pid.pkl')
-_PLATFORM = __import__('platform').system()
 
 
 def _remove_file(path):
@@ -59,6 +60,24 @@ def _remove_file(path):
         return False
 
 
+def _make_executable(path):
+    'Like `chmod +x path`, but without starting a process.'
+    mode = os.stat(path).st_mode
+    os.chmod(path, mode | (mode & 0o444) >> 2)
+
+
+def _spawn(args, **kwds) -> CompletedProcess:
+    '''Run a command by `subprocess.run`, with `close_fds=False` by default.
+
+    NOTE: So that `subprocess` can start the child with `posix_spawn` (if 
+          available) instead of `fork` + `exec`. Don't pass `preexec_fn`, and 
+          prefer an absolute path of the executable, or it will fall back 
+          to `fork`. File descriptors are non-inheritable by default (PEP 446).
+    '''
+    kwds.setdefault('close_fds', False)
+    return sprun(args, **kwds)
+
+
 def winsh_quote(part, _cre=re.compile(r'\s')):
     'Return a shell-escaped string.'
     part = part.strip().replace(r'"', r'\"')
@@ -74,14 +93,14 @@ def winsh_join(split_command: Sequence[str]) -> str:
 
 def start_terminal(cmd, **kwargs) -> CompletedProcess:
     'Start a terminal emulator in current OS platform.'
-    if _PLATFORM == 'Windows':
+    if IS_WINDOWS:
         return start_windows_terminal(cmd, **kwargs)
-    elif _PLATFORM == 'Darwin':
+    elif IS_MACOS:
         # TODO: Solve the custom terminal, just as Linux does
         if kwargs.get('terminal', 'Terminal.app') == 'Terminal.app':
             return start_macosx_terminal(cmd, **kwargs)
         return open_macosx_terminal(cmd, **kwargs)
-    elif _PLATFORM == 'Linux':
+    elif IS_LINUX:
         return start_linux_terminal(cmd, **kwargs)
     else:
         raise NotImplementedError(
@@ -269,10 +288,11 @@ def _wait_for_client(
 ):
     try:
         with _wait_child_process(server_type, timeout=timeout) as address:
-            pickle.dump(
-                {'type': server_type, 'address': address}, 
-                open(_ENV_WAIT_PID_FILE, 'wb')
-            )
+            with open(_ENV_WAIT_PID_FILE, 'wb') as f:
+                pickle.dump(
+                    {'type': server_type, 'address': address}, 
+                    f, pickle.HIGHEST_PROTOCOL, 
+                )
             yield
     finally:
         _remove_file(_ENV_WAIT_PID_FILE)
@@ -281,7 +301,8 @@ def _wait_for_client(
 @suppressed
 def _send_pid_to_server(env=None):
     if env is None:
-        env = pickle.load(open(_ENV_WAIT_PID_FILE, 'rb'))
+        with open(_ENV_WAIT_PID_FILE, 'rb') as f:
+            env = pickle.load(f)
 
     server_type, address = env['type'], env['address']
     if server_type == 'tcpsock':
@@ -352,7 +373,7 @@ def start_linux_terminal(
                 raise NotImplementedError('Failed to detect the terminal app, '
                                           'please specify one')
         app = cast(str, app)
-    split_command: List[str] = [app]
+    split_command: List[str] = [which(app) or app]
     if app_args is None:
         app_name = app.rsplit('/', 1)[-1]
         app_args = cast(List[str], terminal_app_execute_args.get(app_name, []))
@@ -363,19 +384,19 @@ def start_linux_terminal(
     with ensure_cm(_wait_for_client() if wait else None) as port:
         if with_tempfile:
             with NamedTemporaryFile(suffix=tempfile_suffix, mode='w') as f:
-                sprun(['chmod', '+x', f.name], check=True)
+                _make_executable(f.name)
                 if not isinstance(cmd, str):
                     cmd = cast(str, shlex_join(cmd))
                 f.write('%s\n%s\n' % (shebang, cmd))
                 f.flush()
                 split_command.append(f.name)
-                return sprun(split_command, check=True)
+                return _spawn(split_command, check=True)
         if isinstance(cmd, str):
-            return sprun(shlex_join(split_command) + ' ' + cmd, 
-                         check=True, shell=True)
+            return _spawn(shlex_join(split_command) + ' ' + cmd, 
+                          check=True, shell=True)
         else:
             split_command.extend(cmd)
-            return sprun(split_command, check=True)
+            return _spawn(split_command, check=True)
 
 
 AppleScriptWaitEvent = Enum('AppleScriptWaitEvent', ('exists', 'busy'))
@@ -423,14 +444,14 @@ end tell''' % _get_wait_for_str(wait_event)
         tpl_command = 'tell application "{app}" to do script "{script}"'
     if with_tempfile:
         with NamedTemporaryFile(suffix=tempfile_suffix, mode='w') as f:
-            sprun(['chmod', '+x', f.name], check=True)
+            _make_executable(f.name)
             f.write('%s\n%s\n' % (shebang, cmd))
             f.flush()
             command = tpl_command.format(app=app, script=f.name)
-            return sprun(['osascript', '-e', command], check=True)
+            return _spawn(['osascript', '-e', command], check=True)
     else:
         command = tpl_command.format(app=app, script=cmd.replace('"', '\\"'))
-        return sprun(['osascript', '-e', command], check=True)
+        return _spawn(['osascript', '-e', command], check=True)
 
 
 def open_macosx_terminal(
@@ -454,20 +475,20 @@ def open_macosx_terminal(
         split_command.extend(app_args)
     if with_tempfile:
         with NamedTemporaryFile(suffix=tempfile_suffix, mode='w') as f:
-            sprun(['chmod', '+x', f.name], check=True)
+            _make_executable(f.name)
             if not isinstance(cmd, str):
                 cmd = cast(str, shlex_join(cmd))
             f.write('%s\n%s\n' % (shebang, cmd))
             f.flush()
             split_command.append(f.name)
-            return sprun(split_command, check=True)
+            return _spawn(split_command, check=True)
     else:
         if isinstance(cmd, str):
-            return sprun(shlex_join(split_command) + ' ' + cmd, 
-                         check=True, shell=True)
+            return _spawn(shlex_join(split_command) + ' ' + cmd, 
+                          check=True, shell=True)
         else:
             split_command.extend(cmd)
-            return sprun(split_command, check=True)
+            return _spawn(split_command, check=True)
 
 
 if __name__ == '__main__':
@@ -14,19 +14,18 @@ __all__ = [
     'uninstall', 'check_install', 'check_uninstall', 'ensure_import', 
 ]
 
-import platform
 import subprocess
 
-from sys import executable
-from tempfile import NamedTemporaryFile
-from typing import Final, Iterable, List, Optional, Sequence, Union
+from importlib.util import find_spec
+from os import environ
+from sys import executable, modules
+from typing import Iterable, List, Optional, Sequence, Union
 from types import ModuleType
 from urllib.parse import urlsplit
-from urllib.request import urlopen
+
+from .platform_const import IS_WINDOWS as _PLATFORM_IS_WINDOWS
 
 
-# When using subprocess.run on Windows, you should specify shell=True
-_PLATFORM_IS_WINDOWS: Final[bool] = platform.system() == 'Windows'
 ## The following two may be redundant
 # INDEX_URL: Base URL of the Python Package Index (default https://pypi.org/simple). 
 #     This should point to a repository compliant with PEP 503 (the simple repository API)
@@ -35,6 +34,12 @@ INDEX_URL: str = 'https://mirrors.aliyun.com/pypi/simple/'
 # TRUSTED_HOST: Mark this host or host:port pair as trusted,
 #     even though it does not have valid or any HTTPS.
 TRUSTED_HOST: str = 'mirrors.aliyun.com'
+# SKIP_INSTALL: If True, `check_install` will never try to install anything, 
+#     for those who manage their own environment. 
+#     It can be turned on by setting the environment variable `INJCONSOLE_SKIP_DEPS=1`.
+SKIP_INSTALL: bool = environ.get('INJCONSOLE_SKIP_DEPS', '') not in ('', '0')
+# Modules which have been found by `check_install`
+_FOUND_MODULES: set = set()
 
 if _PLATFORM_IS_WINDOWS:
     import site as _site
@@ -117,10 +122,15 @@ def install_pip_by_getpip(
         - https://bootstrap.pypa.io/get-pip.py
         - https://packaging.python.org/tutorials/installing-packages/#ensure-you-can-run-pip-from-the-command-line
     '''
+    # Imported here, they are slow to import (`urllib.request` pulls in `http`, 
+    # `email` and `ssl`) and only needed in this rare case
+    from tempfile import NamedTemporaryFile
+    from urllib.request import urlopen
+
     with NamedTemporaryFile(mode='wb', suffix='.py') as f:
         f.write('''\
 #!/usr/bin/env python
-if platform.system() == 'Windows':
+if __import__('sys').platform == 'win32':
     import site as _site
     from os import path as _path
 
@@ -143,8 +153,7 @@ if platform.system() == 'Windows':
         )
         f.write(response.read())
         f.flush()
-        return subprocess.run([executable, f.name, *args], 
-                              check=check, shell=_PLATFORM_IS_WINDOWS)
+        return subprocess.run([executable, f.name, *args], check=check)
 
 
 def install_pip(executable: str = executable) -> None:
@@ -182,7 +191,8 @@ def execute_pip_in_child_process(
         return subprocess.run(command, shell=True)
     else:
         command = [executable, '-m', 'pip', *args]
-        return subprocess.run(command, shell=_PLATFORM_IS_WINDOWS)
+        # A list of arguments does not need a shell, also on Windows
+        return subprocess.run(command)
 
 
 def install(
@@ -232,11 +242,30 @@ def uninstall(
         execute_pip(cmd)
 
 
+def _module_exists(module: str) -> bool:
+    '''Check whether the `module` can be found, without importing it 
+    (but its parent packages will be imported). The result of found is cached.'''
+    if module in _FOUND_MODULES or module in modules:
+        return True
+    try:
+        found = find_spec(module) is not None
+    except (ImportError, ValueError):
+        # ImportError: A parent package can't be imported
+        # ValueError: `module` is in `sys.modules`, but its `__spec__` is None
+        found = False
+    if found:
+        _FOUND_MODULES.add(module)
+    return found
+
+
 def check_install(
     module: str, 
     depencies: Union[None, str, Iterable[str]]= None,
 ) -> None:
-    'Import the `module`, if it does not exist, try to install the `depencies`'
+    '''Check the `module` (by finding but not importing it), if it does not exist, 
+    try to install the `depencies`'''
+    if SKIP_INSTALL or _module_exists(module):
+        return
     try:
         __import__(module)
     except ModuleNotFoundError:
@@ -262,7 +262,8 @@ class TkinterXMLConfigParser:
         parser=None, 
         set_name_to_namespace: bool = False, 
     ) -> None:
-        self._text: bytes = open(path, 'rb').read()
+        with open(path, 'rb') as f:
+            self._text: bytes = f.read()
         self._root = fromstring(self._text, parser)
 
         if namespace is None: